@@ -1,12 +1,138 @@
+import copy
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import mmap
 import os
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
 import pandas as pd
 import yaml
-import matplotlib.pyplot as plt
-import seaborn as sns
-from mpl_toolkits.mplot3d import Axes3D
 
 import pickle as pkl
-from scipy.cluster.hierarchy import dendrogram, linkage
+
+# matplotlib, seaborn, scipy, pyarrow, openpyxl and zstandard are imported inside the functions
+# that use them, so callers that only need some of the helpers do not pay every import cost
+logger = logging.getLogger(__name__)
+
+# Row count above which save_dict_to_excel streams rows with openpyxl's write-only workbook
+EXCEL_WRITE_ONLY_ROWS = 50_000
+
+# Rows above which plot_distribution fits its KDE on a random sample of this size
+KDE_SAMPLE_ROWS = 50_000
+# Largest correlation matrix (columns) whose cells plot_correlation_matrix annotates
+HEATMAP_ANNOT_MAX = 20
+# Points above which scatter plots are drawn as a single raster layer
+SCATTER_RASTER_ROWS = 20_000
+# Points above which scatter_plot bins the data into a hexbin plot (when no hue is given)
+SCATTER_HEXBIN_ROWS = 200_000
+
+# Write buffer size and pandas row chunk size used by save_dataframe_to_csv
+CSV_BUFFER_SIZE = 1024 * 1024
+CSV_CHUNK_SIZE = 100_000
+
+# Write buffer size used by export_to_pickle
+PICKLE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Rows per block for which save_dict_to_excel_fast formats cells at a time
+XLSX_ROW_BLOCK = 10_000
+# Total cells above which save_dict_to_excel_fast serializes sheets in worker processes
+XLSX_PARALLEL_CELLS = 1_000_000
+
+# Characters XML 1.0 does not allow in text, and characters Excel does not allow in sheet names
+_XML_ILLEGAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+_SHEET_NAME_ILLEGAL_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+# Fixed package parts used by save_dict_to_excel_fast
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{overrides}'
+    '</Types>'
+)
+_XLSX_SHEET_OVERRIDE = (
+    '<Override PartName="/xl/worksheets/sheet{n}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_SHEET = '<sheet name={name} sheetId="{n}" r:id="rId{n}"/>'
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{rels}'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK_REL = (
+    '<Relationship Id="rId{n}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{n}.xml"/>'
+)
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+def _ensure_dir(folder):
+    """
+    Creates a folder (and its parents) if needed.
+
+    Results are cached per absolute folder path, so repeated saves into the same folder skip the
+    filesystem call while a relative folder still follows os.chdir; a folder removed while the
+    process is running is not re-created.
+    """
+    _make_dirs(os.path.abspath(folder))
+
+@functools.lru_cache(maxsize=None)
+def _make_dirs(path):
+    """
+    Cached os.makedirs for _ensure_dir; path must be absolute.
+    """
+    os.makedirs(path, exist_ok=True)
+
+def _arrow_csv_compatible(df):
+    """
+    Returns True if Arrow's CSV writer can write df's rows so that pd.read_csv gives back the same
+    values and dtypes as the df.to_csv output: every column is an integer column or a float column
+    holding at least one non-whole value, and column names are unique.
+
+    Booleans, datetimes, strings and whole-valued floats are written differently by Arrow
+    (true, 2020-01-01 00:00:00.000000, quoted fields, 1 instead of 1.0), so those frames go to pandas.
+    """
+    if not df.columns.is_unique or len(df.columns) == 0:
+        return False
+    # A single-column row with a missing value would be written as a blank line, which readers skip
+    if len(df.columns) == 1 and df.iloc[:, 0].isna().any():
+        return False
+    for _, column in df.items():
+        if column.dtype.kind in "iu":
+            continue
+        if column.dtype.kind != "f":
+            return False
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        if not (values != np.floor(values)).any():
+            return False
+    return True
 
 def save_dataframe_to_csv(df, file_name, folder="output"):
     """
@@ -18,20 +144,54 @@ def save_dataframe_to_csv(df, file_name, folder="output"):
     - folder (str): The folder where the file will be saved. Defaults to 'output'.
 
     If the folder doesn't exist, it will be created. If the file already exists, it will be overwritten.
+    Frames whose columns are all integers or non-whole floats are written with pyarrow's CSV writer,
+    which may spell floats differently from df.to_csv (0.00001 rather than 1e-05); other frames are
+    written with df.to_csv.
     """
+    import pyarrow as pa
+    import pyarrow.csv as pac
     # Ensure the folder exists
     file_name = file_name if file_name.endswith('.csv') else f"{file_name}.csv"
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    _ensure_dir(folder)
     
     # Construct the full file path
     file_path = os.path.join(folder, file_name)
     
-    # Save the DataFrame to CSV
-    df.to_csv(file_path, index=False)
-    print(f"DataFrame saved to {file_path}")
+    # Integer and non-whole float frames are written with Arrow's C++ writer; everything else goes
+    # to pandas. Arrow spells some floats differently (0.00001 for 1e-05, 2.5e+15 for
+    # 2500000000000000.0) but they read back as the same values
+    table = None
+    if _arrow_csv_compatible(df):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, ValueError):
+            table = None
+
+    # Both writers go through one large buffered handle instead of the default small buffer
+    with open(file_path, "wb", buffering=CSV_BUFFER_SIZE) as file:
+        if table is not None:
+            try:
+                # pandas writes the header so column names are quoted the same way as in to_csv
+                df.iloc[:0].to_csv(file, index=False)
+                pac.write_csv(table, file, write_options=pac.WriteOptions(batch_size=65536, include_header=False))
+            except (pa.ArrowException, ValueError):
+                # Discard whatever Arrow wrote before failing and start over with pandas
+                file.seek(0)
+                file.truncate()
+                table = None
+        if table is None:
+            df.to_csv(file, index=False, chunksize=CSV_CHUNK_SIZE)
+    logger.debug("DataFrame saved to %s", file_path)
+
+def _excel_column_list(column):
+    """
+    Returns a column's values as a list for openpyxl, with missing values replaced by None.
+    """
+    if not column.hasnans:
+        return column.tolist()
+    return column.astype(object).where(column.notna(), None).tolist()
 
-def save_dict_to_excel(data_dict, file_name, folder="output"):
+def save_dict_to_excel(data_dict, file_name, folder="output", fast=False):
     """
     Saves a dictionary of DataFrames to an Excel file in the specified folder.
 
@@ -39,23 +199,198 @@ def save_dict_to_excel(data_dict, file_name, folder="output"):
     - data_dict (dict): A dictionary where keys are sheet names and values are DataFrames.
     - file_name (str): The name of the Excel file (with .xlsx extension).
     - folder (str): The folder where the file will be saved. Defaults to 'output'.
+    - fast (bool): If True, write the sheet XML directly with save_dict_to_excel_fast. Defaults to False.
 
     If the folder doesn't exist, it will be created. If the file already exists, it will be overwritten.
+    Sheets are written with xlsxwriter; if any DataFrame has more than EXCEL_WRITE_ONLY_ROWS rows
+    the whole workbook is streamed with openpyxl's write-only mode instead.
     """
+    if fast:
+        return save_dict_to_excel_fast(data_dict, file_name, folder)
+
     # Ensure the folder exists
     file_name = file_name if file_name.endswith('.xlsx') else f"{file_name}.xlsx"
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    _ensure_dir(folder)
     
     # Construct the full file path
     file_path = os.path.join(folder, file_name)
     
-    # Save the dictionary of DataFrames to Excel
-    with pd.ExcelWriter(file_path) as writer:
+    # Very large frames go through openpyxl's write-only (streaming) workbook,
+    # which skips the per-cell styling work done by df.to_excel
+    if any(len(df) > EXCEL_WRITE_ONLY_ROWS for df in data_dict.values()):
+        import openpyxl
+        wb = openpyxl.Workbook(write_only=True)
         for sheet_name, df in data_dict.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            ws = wb.create_sheet(sheet_name)
+            ws.append(list(df.columns))
+            # Zip over whole-column lists rather than building a row object per record; missing
+            # values (NaN, NaT, pd.NA) become None, which openpyxl writes as an empty cell
+            columns = [_excel_column_list(df.iloc[:, i]) for i in range(len(df.columns))]
+            for row in zip(*columns):
+                ws.append(row)
+        wb.save(file_path)
+    else:
+        with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
+            for sheet_name, df in data_dict.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
     
-    print(f"Excel file saved to {file_path}")
+    logger.debug("Excel file saved to %s", file_path)
+
+def _excel_column_letter(index):
+    """
+    Converts a zero-based column index to its Excel column letters (0 -> 'A', 26 -> 'AA').
+    """
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _xml_text(value):
+    """
+    Escapes a value for use as XML text, dropping the control characters XML does not allow.
+    """
+    return escape(_XML_ILLEGAL_CHARS.sub("", str(value)))
+
+def _check_sheet_names(names):
+    """
+    Raises ValueError for sheet names Excel would refuse to open.
+    """
+    seen = set()
+    for name in names:
+        name = str(name)
+        if not 0 < len(name) <= 31:
+            raise ValueError(f"Sheet name must be 1 to 31 characters long: {name!r}")
+        if _SHEET_NAME_ILLEGAL_CHARS.search(name) or name.startswith("'") or name.endswith("'"):
+            raise ValueError(f"Sheet name contains characters Excel does not allow: {name!r}")
+        if name.lower() in seen:
+            raise ValueError(f"Duplicate sheet name: {name!r}")
+        seen.add(name.lower())
+
+def _excel_column_values(column):
+    """
+    Returns a column's values as a numpy array; nullable numeric columns (Int64, Float64, ...)
+    become float64 with NaN for missing values, so they are written as numbers.
+    """
+    if isinstance(column.dtype, pd.api.extensions.ExtensionDtype) and column.dtype.kind in "iuf":
+        return column.to_numpy(dtype="float64", na_value=np.nan)
+    return column.to_numpy()
+
+def _excel_column_cells(values, letter, first_row):
+    """
+    Builds the <c> elements of a block of one DataFrame column, starting at row first_row.
+
+    Numeric and boolean columns are formatted in one vectorized pass; everything else is written
+    as inline strings. Missing and non-finite values produce no cell.
+    """
+    refs = np.char.add(letter, np.arange(first_row, first_row + len(values)).astype(str))
+    if values.dtype.kind == "b":
+        head = np.char.add('<c r="', np.char.add(refs, '" t="b"><v>'))
+        return np.char.add(head, np.char.add(values.astype(np.int8).astype(str), "</v></c>"))
+    if values.dtype.kind in "iu":
+        head = np.char.add('<c r="', np.char.add(refs, '" t="n"><v>'))
+        return np.char.add(head, np.char.add(np.char.mod("%d", values), "</v></c>"))
+    if values.dtype.kind == "f":
+        head = np.char.add('<c r="', np.char.add(refs, '" t="n"><v>'))
+        cells = np.char.add(head, np.char.add(values.astype(str), "</v></c>"))
+        return np.where(np.isfinite(values), cells, "")
+    cells = [
+        "" if pd.isna(value) else f'<c r="{ref}" t="inlineStr"><is><t>{_xml_text(value)}</t></is></c>'
+        for ref, value in zip(refs, values)
+    ]
+    return np.array(cells, dtype=object)
+
+def _iter_sheet_xml(df):
+    """
+    Yields the XML of one worksheet part, one <row> element at a time.
+
+    Cells are formatted XLSX_ROW_BLOCK rows at a time, so memory use does not grow with the frame.
+    """
+    letters = [_excel_column_letter(i) for i in range(len(df.columns))]
+    yield _XLSX_SHEET_HEAD
+    header = "".join(
+        f'<c r="{letter}1" t="inlineStr"><is><t>{_xml_text(column)}</t></is></c>'
+        for letter, column in zip(letters, df.columns)
+    )
+    yield f'<row r="1">{header}</row>'
+    for start in range(0, len(df), XLSX_ROW_BLOCK):
+        block = df.iloc[start:start + XLSX_ROW_BLOCK]
+        first_row = start + 2
+        columns = [
+            _excel_column_cells(_excel_column_values(block.iloc[:, i]), letter, first_row)
+            for i, letter in enumerate(letters)
+        ]
+        for row_number, cells in enumerate(zip(*columns), start=first_row):
+            yield f'<row r="{row_number}">{"".join(cells)}</row>'
+    yield _XLSX_SHEET_TAIL
+
+def _write_one_sheet(df):
+    """
+    Serializes one DataFrame to the bytes of its xl/worksheets/sheetN.xml part.
+
+    Kept at module level so it can be sent to ProcessPoolExecutor workers.
+    """
+    return "".join(_iter_sheet_xml(df)).encode("utf-8")
+
+def save_dict_to_excel_fast(data_dict, file_name, folder="output", max_workers=None):
+    """
+    Saves a dictionary of DataFrames to an Excel file by writing the worksheet XML directly.
+
+    Parameters:
+    - data_dict (dict): A dictionary where keys are sheet names and values are DataFrames.
+    - file_name (str): The name of the Excel file (with .xlsx extension).
+    - folder (str): The folder where the file will be saved. Defaults to 'output'.
+    - max_workers (int): Number of worker processes used to serialize sheets when there is more than
+      one sheet and more than XLSX_PARALLEL_CELLS cells in total. Defaults to None (one per CPU).
+
+    Intended for plain numeric/string DataFrames (cluster assignments, PCA loadings, ...). No Excel
+    library is involved, so cells carry values only: no styles, column widths or date formats.
+    Smaller workbooks are streamed into the zip one row at a time; above XLSX_PARALLEL_CELLS cells,
+    sheets are serialized in parallel and zipped in the calling process.
+    If the folder doesn't exist, it will be created. If the file already exists, it will be overwritten.
+
+    Raises:
+    - ValueError: If data_dict is empty or a sheet name is not valid in Excel.
+    """
+    if not data_dict:
+        raise ValueError("data_dict must contain at least one DataFrame")
+    _check_sheet_names(data_dict)
+
+    # Ensure the folder exists
+    file_name = file_name if file_name.endswith('.xlsx') else f"{file_name}.xlsx"
+    _ensure_dir(folder)
+
+    # Construct the full file path
+    file_path = os.path.join(folder, file_name)
+
+    sheet_numbers = range(1, len(data_dict) + 1)
+    frames = list(data_dict.values())
+    # Worker start-up and pickling the frames out and the XML back only pay off for large workbooks
+    if len(frames) > 1 and sum(df.size for df in frames) > XLSX_PARALLEL_CELLS:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            sheets = list(executor.map(_write_one_sheet, frames))
+    else:
+        sheets = [None] * len(frames)
+
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES.format(
+            overrides="".join(_XLSX_SHEET_OVERRIDE.format(n=n) for n in sheet_numbers)))
+        archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        archive.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(
+            sheets="".join(_XLSX_WORKBOOK_SHEET.format(name=quoteattr(str(name)), n=n)
+                           for n, name in zip(sheet_numbers, data_dict))))
+        archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS.format(
+            rels="".join(_XLSX_WORKBOOK_REL.format(n=n) for n in sheet_numbers)))
+        for n, df, sheet in zip(sheet_numbers, frames, sheets):
+            if sheet is not None:
+                archive.writestr(f"xl/worksheets/sheet{n}.xml", sheet)
+                continue
+            with archive.open(f"xl/worksheets/sheet{n}.xml", "w") as part:
+                for chunk in _iter_sheet_xml(df):
+                    part.write(chunk.encode("utf-8"))
+
+    logger.debug("Excel file saved to %s", file_path)
 
 def read_config(config_file_name="config.yaml",config_folder="Config"):
     """
@@ -68,26 +403,104 @@ def read_config(config_file_name="config.yaml",config_folder="Config"):
 
     Returns:
     - dict: The contents of the configuration file as a dictionary.
+      Parsed contents are cached in memory and in a sibling '<name>.cache.json' file until the
+      YAML file is modified.
 
     Raises:
     - FileNotFoundError: If the configuration file does not exist.
     """
     # Construct the full path to the configuration file
     base_folder = os.path.join(os.path.abspath(os.path.dirname(__file__)),"..")  # Get the directory of the current file
-    print(base_folder)
     config_path = os.path.join(base_folder, config_folder, config_file_name)
     
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    # Read and return the configuration file contents
+    # Parsed contents are memoized per (path, mtime), so editing the file invalidates the cache;
+    # each caller gets its own copy so mutating it cannot leak into later calls
+    return copy.deepcopy(_load_config(os.path.abspath(config_path), os.path.getmtime(config_path)))
+
+def _is_json_round_trippable(data):
+    """
+    Returns True if json.dump followed by json.load gives back exactly the same value
+    (string keys only, plain scalars, lists and dicts).
+    """
+    if isinstance(data, dict):
+        return all(isinstance(key, str) and _is_json_round_trippable(value) for key, value in data.items())
+    if isinstance(data, list):
+        return all(_is_json_round_trippable(item) for item in data)
+    return data is None or isinstance(data, (str, int, float, bool))
+
+@functools.lru_cache(maxsize=None)
+def _load_config(config_path, mtime):
+    """
+    Loads a YAML configuration file, going through a sibling '<name>.cache.json' file when it is
+    at least as recent as the YAML, and refreshing that JSON cache otherwise.
+
+    The mtime argument is only part of the lru_cache key.
+    """
+    cache_path = config_path + ".cache.json"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= mtime:
+        # An unreadable or corrupt cache is ignored and rebuilt from the YAML
+        try:
+            with open(cache_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            pass
+
+    # Read the configuration file contents, using libyaml when it is available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(config_path, 'r') as file:
-        config_data = yaml.safe_load(file)
-    
+        config_data = yaml.load(file, Loader=loader)
+
+    # The JSON cache is only an optimisation: it is skipped for configs JSON would alter
+    # (non-string keys, dates, ...) and for read-only folders. It is written to a temporary
+    # file and moved into place so other processes never see a partially written cache.
+    if _is_json_round_trippable(config_data):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        except OSError:
+            return config_data
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(config_data, file)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     return config_data
 
 
-def plot_correlation_matrix(df,title = "Correlation Matrix", figsize=(10, 8)):
+def correlation_matrix(df):
+    """
+    Computes the Pearson correlation matrix of the numeric and boolean columns of a DataFrame.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame for which to compute the correlation matrix.
+
+    Returns:
+    - pd.DataFrame: The correlation matrix, labelled with the numeric column names.
+
+    Frames without missing values are standardized in float64 and correlated with a single
+    X.T @ X matrix product in float32 (one BLAS SGEMM call). Results match df.corr to within ~1e-4,
+    which is ample for plotting; frames with missing values use pandas' pairwise-complete df.corr.
+    """
+    numeric = df.select_dtypes(include=[np.number, "bool"])
+    # Always a fresh array: it is standardized in place below
+    values = numeric.to_numpy(dtype=np.float64, copy=True)
+    if np.isnan(values).any():
+        return numeric.corr(method="pearson")
+    # Centering and scaling run in float64 so columns with a large offset (timestamps, IDs) keep
+    # their precision; only the standardized matrix is cast to float32 for the product
+    values -= values.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values /= values.std(axis=0)
+    values = values.astype(np.float32)
+    corr = (values.T @ values) / len(values)
+    return pd.DataFrame(corr, index=numeric.columns, columns=numeric.columns)
+
+def plot_correlation_matrix(df,title = "Correlation Matrix", figsize=(10, 8), corr=None):
     """
     Plots a correlation matrix for the given DataFrame.
 
@@ -95,9 +508,15 @@ def plot_correlation_matrix(df,title = "Correlation Matrix", figsize=(10, 8)):
     - df (pd.DataFrame): The DataFrame for which to plot the correlation matrix.
     - title (str): The title of the plot. Defaults to "Correlation Matrix".
     - figsize (tuple): The size of the figure. Defaults to (10, 8).
+    - corr (pd.DataFrame or np.ndarray): A precomputed correlation matrix to plot instead of
+      computing one from df. Defaults to None.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if corr is None:
+        corr = correlation_matrix(df)
     plt.figure(figsize=figsize)
-    sns.heatmap(df.corr(), annot=True, fmt=".2f", cmap='coolwarm', square=True, cbar_kws={"shrink": .8})
+    sns.heatmap(corr, annot=np.shape(corr)[0] <= HEATMAP_ANNOT_MAX, fmt=".2f", cmap='coolwarm', square=True, cbar_kws={"shrink": .8})
     plt.title(title)
     plt.xticks(rotation=45)
     plt.yticks(rotation=0)
@@ -112,9 +531,29 @@ def plot_distribution(df,column, title="Distribution Plot", figsize=(10, 6)):
     - column (str): The column for which to plot the distribution.
     - title (str): The title of the plot. Defaults to "Distribution Plot".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
+
+    The histogram always uses every row. Above KDE_SAMPLE_ROWS rows the KDE curve is fitted on a
+    random sample and evaluated on a 200-point grid instead of seaborn's full-data KDE; no curve is
+    drawn when there are fewer than two distinct values.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from scipy.stats import gaussian_kde
     plt.figure(figsize=figsize)
-    sns.histplot(df[column], kde=True, bins=30)
+    if len(df) > KDE_SAMPLE_ROWS:
+        values = df[column].dropna()
+        color = sns.color_palette()[0]
+        edges = np.histogram_bin_edges(values, bins=30)
+        sns.histplot(values, kde=False, bins=edges, color=color)
+        sample = values.sample(KDE_SAMPLE_ROWS, random_state=0) if len(values) > KDE_SAMPLE_ROWS else values
+        grid = np.linspace(edges[0], edges[-1], 200)
+        # A KDE needs at least two distinct values; like seaborn, leave the curve out otherwise
+        if sample.nunique() >= 2:
+            # Scale the density to histogram counts so the curve overlays the bars
+            density = gaussian_kde(sample.to_numpy(dtype=np.float64))(grid) * len(values) * (edges[1] - edges[0])
+            plt.plot(grid, density, color=color)
+    else:
+        sns.histplot(df[column], kde=True, bins=30)
     plt.title(title)
     plt.xlabel(column)
     plt.ylabel('Frequency')
@@ -134,9 +573,18 @@ def scatter_plot(df, x_column, y_column, title="Scatter Plot", figsize=(10, 6),
     - y_column (str): The column for the y-axis.
     - title (str): The title of the plot. Defaults to "Scatter Plot".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
+
+    Above SCATTER_RASTER_ROWS points the markers are rasterized. Above SCATTER_HEXBIN_ROWS points,
+    and when no hue is given, the points are binned into a hexbin density plot instead.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     plt.figure(figsize=figsize)
-    sns.scatterplot(data=df, x=x_column, y=y_column,hue= hue, palette='viridis')
+    if hue is None and len(df) > SCATTER_HEXBIN_ROWS:
+        plt.hexbin(df[x_column], df[y_column], gridsize=100, cmap='viridis', mincnt=1)
+        plt.colorbar(label='Count')
+    else:
+        sns.scatterplot(data=df, x=x_column, y=y_column,hue= hue, palette='viridis', rasterized=len(df) > SCATTER_RASTER_ROWS)
     plt.title(title)
     plt.xlabel(x_column)
     plt.ylabel(y_column)
@@ -152,6 +600,8 @@ def box_plot(df, column, title="Box Plot", figsize=(10, 6)):
     - title (str): The title of the plot. Defaults to "Box Plot".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     plt.figure(figsize=figsize)
     sns.boxplot(x=df[column])
     plt.title(title)
@@ -163,15 +613,26 @@ def plot_dendrogram(clusters, levels,method='ward', figsize=(10, 8)):
     Plots a dendrogram for hierarchical clustering of the DataFrame.
 
     Parameters:
-    - df (pd.DataFrame): The DataFrame containing the data.
+    - clusters (np.ndarray): The linkage matrix returned by scipy's linkage.
+    - levels (int): The number of merge levels from the top of the tree to show.
     - method (str): The linkage method to use for clustering. Defaults to 'ward'.
     - figsize (tuple): The size of the figure. Defaults to (10, 8).
+
+    The truncated tree layout is computed with scipy (no_plot=True) and every link is drawn
+    through a single LineCollection.
     """
-    
-    
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from scipy.cluster.hierarchy import dendrogram
+    tree = dendrogram(clusters, truncate_mode="level", p=levels, no_plot=True, distance_sort='descending')
+    segments = [np.column_stack([xs, ys]) for xs, ys in zip(tree['icoord'], tree['dcoord'])]
+
     plt.figure(figsize=figsize)
-    
-    dendrogram(clusters, orientation='top',truncate_mode="level",p=levels ,no_labels=True, distance_sort='descending', show_leaf_counts=True)
+    ax = plt.gca()
+    ax.add_collection(LineCollection(segments, colors=tree['color_list']))
+    ax.set_xlim(0, 10 * len(tree['leaves']))
+    ax.set_ylim(0, 1.05 * max(max(ys) for ys in tree['dcoord']))
+    ax.set_xticks([])
     plt.title('Hierarchical Clustering Dendrogram')
     plt.xlabel('Observations')
     plt.ylabel('Distance')
@@ -186,6 +647,7 @@ def plot_elbow(wcss, title="Elbow Method", figsize=(10, 6)):
     - title (str): The title of the plot. Defaults to "Elbow Method".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
     """
+    import matplotlib.pyplot as plt
     plt.figure(figsize=figsize)
     plt.plot(range(1, len(wcss) + 1), wcss, marker='o')
     plt.title(title)
@@ -207,6 +669,8 @@ def plot_line_chart(df, x_column, y_column, title="Line Chart", figsize=(10, 6))
     - title (str): The title of the plot. Defaults to "Line Chart".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     plt.figure(figsize=figsize)
     sns.lineplot(data=df, x=x_column, y=y_column,markers='o', dashes=False)
     plt.xticks(rotation=45)
@@ -224,6 +688,7 @@ def plot_pca_explained_variance(pca, title="PCA Explained Variance", figsize=(10
     - title (str): The title of the plot. Defaults to "PCA Explained Variance".
     - figsize (tuple): The size of the figure. Defaults to (10, 6).
     """
+    import matplotlib.pyplot as plt
     plt.figure(figsize=figsize)
     plt.plot(range(1, len(pca.explained_variance_ratio_) + 1), pca.explained_variance_ratio_.cumsum(), marker='o', linestyle='-', alpha=0.7)
     plt.title(title)
@@ -244,15 +709,22 @@ def plot_3d_scatter(df, x_col, y_col, z_col, hue_col=None, title="3D Scatter Plo
     - z_col (str): The column for the z-axis.
     - hue_col (str): The column for coloring the points (optional).
     - title (str): The title of the plot. Defaults to "3D Scatter Plot".
+
+    Above SCATTER_RASTER_ROWS points the markers are rasterized at 100 dpi.
     """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (registers the '3d' projection)
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
+    rasterized = len(df) > SCATTER_RASTER_ROWS
+    if rasterized:
+        fig.set_dpi(100)
     
     if hue_col:
-        scatter = ax.scatter(df[x_col], df[y_col], df[z_col], c=df[hue_col], cmap='viridis', s=50)
+        scatter = ax.scatter(df[x_col], df[y_col], df[z_col], c=df[hue_col], cmap='viridis', s=50, rasterized=rasterized)
         plt.colorbar(scatter, ax=ax, label=hue_col)
     else:
-        ax.scatter(df[x_col], df[y_col], df[z_col], s=50)
+        ax.scatter(df[x_col], df[y_col], df[z_col], s=50, rasterized=rasterized)
     
     ax.set_xlabel(x_col)
     ax.set_ylabel(y_col)
@@ -260,16 +732,78 @@ def plot_3d_scatter(df, x_col, y_col, z_col, hue_col=None, title="3D Scatter Plo
     ax.set_title(title)
     plt.show()
 
-def export_to_pickle(object,filename,folder = "artifacts"):
+def _pickle_file_name(filename, compress):
+    """
+    Adds the '.pickle' extension, and the '.zst' suffix for compressed pickles, when missing.
+    """
     filename = f"{filename}.pickle" if ".pickle" not in filename else filename
+    if compress and not filename.endswith(".zst"):
+        filename = f"{filename}.zst"
+    return filename
+
+def export_to_pickle(object,filename,folder = "artifacts", compress=True):
+    """
+    Pickles an object to the Data/<folder> directory next to the current working directory.
+
+    Parameters:
+    - object: The object to save (fitted scaler, PCA, clustering model, ...).
+    - filename (str): The name of the file. '.pickle' (and '.zst' when compressed) is appended if missing.
+    - folder (str): The folder under Data where the file will be saved. Defaults to 'artifacts'.
+    - compress (bool): If True, the pickle stream is zstandard-compressed into a '.pickle.zst' file.
+      Defaults to True.
+    """
+    import zstandard as zstd
+    filename = _pickle_file_name(filename, compress)
     filepath = os.path.join(os.getcwd(),"..","Data",folder)
 
-    if not os.path.exists(filepath):
-        os.makedirs(filepath)
+    _ensure_dir(filepath)
 
     filepath = os.path.join(filepath,filename)
 
-    pkl.dump(object,open(filepath,"wb"))
-    print("object saved at : ",filepath)
+    # Highest protocol (5 on Python 3.8+) writes ndarray data in large frames; the big
+    # write buffer keeps the number of write syscalls low for large models
+    with open(filepath, "wb", buffering=PICKLE_BUFFER_SIZE) as file:
+        if filepath.endswith(".zst"):
+            cctx = zstd.ZstdCompressor(level=3, threads=-1)
+            with cctx.stream_writer(file) as writer:
+                pkl.dump(object, writer, protocol=pkl.HIGHEST_PROTOCOL)
+        else:
+            pkl.dump(object, file, protocol=pkl.HIGHEST_PROTOCOL)
+    logger.debug("Object saved to %s", filepath)
+
+def load_pickle_object(filename, folder="artifacts"):
+    """
+    Loads an object saved with export_to_pickle from the Data/<folder> directory.
+
+    Parameters:
+    - filename (str): The name of the file, with or without the '.pickle' / '.pickle.zst' extension.
+      Without an extension the compressed '.pickle.zst' file is preferred over a plain '.pickle' one.
+    - folder (str): The folder under Data where the file is stored. Defaults to 'artifacts'.
+
+    Returns:
+    - The unpickled object.
 
+    Raises:
+    - FileNotFoundError: If the pickle file does not exist.
+    - EOFError: If the pickle file is empty.
+    """
+    import zstandard as zstd
+    folder_path = os.path.join(os.getcwd(),"..","Data",folder)
+    # A name given with its extension is loaded as is; only a bare name probes the '.zst' file first
+    filepath = os.path.join(folder_path, _pickle_file_name(filename, compress=".pickle" not in filename))
+    if not os.path.exists(filepath) and ".pickle" not in filename:
+        filepath = os.path.join(folder_path, _pickle_file_name(filename, compress=False))
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Pickle file not found: {filepath}")
+    # An empty file cannot be memory mapped; report it the way pickle reports an empty stream
+    if os.path.getsize(filepath) == 0:
+        raise EOFError(f"Pickle file is empty: {filepath}")
+
+    # Read through a read-only memory map so pages are faulted in on demand instead of
+    # being copied through an intermediate read buffer
+    with open(filepath, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if filepath.endswith(".zst"):
+            with zstd.ZstdDecompressor().stream_reader(mapped) as reader:
+                return pkl.load(reader)
+        return pkl.load(mapped)
 